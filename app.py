@@ -1,37 +1,62 @@
+from functools import lru_cache
+
 import streamlit as st
-import pandas as pd
-import altair as alt
+
+# --------------------------------------------
+# 📝 Textos estáticos da interface
+# --------------------------------------------
+
+TITULO_PAGINA = "Simulador de Custos de Viagem"
+TITULO = "✈️ Simulador Inteligente de Custos de Viagem"
+LEGENDA = "Calcule de forma rápida e fácil o custo total da viagem, combustível e custo por pessoa."
+OPCOES_SIMULACAO = ("Simulação Completa da Viagem", "Simulação de Custo de Combustível")
 
 # --------------------------------------------
 # 🔧 Funções auxiliares
 # --------------------------------------------
 
+# Troca ',' <-> '.' numa única passada (padrão americano -> brasileiro).
+# `locale.currency` não é usado: depende do locale pt_BR instalado no host,
+# `setlocale` altera o estado global do processo (compartilhado por todas as
+# sessões do Streamlit) e a própria função é implementada em Python.
+_MOEDA_TR = str.maketrans({",": ".", ".": ","})
+
+@lru_cache(maxsize=4096)
 def formatar_moeda(valor):
     # Recebe um número (float/int) e retorna uma string formatada em real brasileiro.
     # Exemplo: 2100.5 -> 'R$ 2.100,50'
-    return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return "R$ " + f"{valor:,.2f}".translate(_MOEDA_TR)
 
+@lru_cache(maxsize=4096)
 def formatar_numero(valor, sufixo=""):
     # Formata um número com separador de milhar e decimal no padrão brasileiro
     # e adiciona um sufixo (por exemplo ' L' para litros).
-    return f"{valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".") + sufixo
+    return f"{valor:,.2f}".translate(_MOEDA_TR) + sufixo
 
 # --------------------------------------------
 # ⛽ Função de Cálculo — Combustível
 # --------------------------------------------
 
-def calcular_combustivel(distancia_total, consumo_km_litro, preco_combustivel, num_viajantes):
-    # Calcula litros necessários e custos relativos ao combustível.
-    # Validações básicas: nenhum dos valores pode ser menor ou igual a zero.
-    if distancia_total <= 0 or consumo_km_litro <= 0 or preco_combustivel <= 0 or num_viajantes <= 0:
-        return None
-
+def _kernel_combustivel(distancia_total, consumo_km_litro, preco_combustivel, num_viajantes):
+    # Núcleo aritmético do cálculo de combustível (sem validação nem formatação).
     # Litros necessários para percorrer a distância total
     litros_necessarios = distancia_total / consumo_km_litro
     # Custo total de combustível para a viagem
     custo_total = litros_necessarios * preco_combustivel
     # Custo dividido por viajante
     custo_por_pessoa = custo_total / num_viajantes
+    return litros_necessarios, custo_total, custo_por_pessoa
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def calcular_combustivel(distancia_total, consumo_km_litro, preco_combustivel, num_viajantes):
+    # Calcula litros necessários e custos relativos ao combustível.
+    # Validações básicas: nenhum dos valores pode ser menor ou igual a zero.
+    if distancia_total <= 0 or consumo_km_litro <= 0 or preco_combustivel <= 0 or num_viajantes <= 0:
+        return None
+
+    litros_necessarios, custo_total, custo_por_pessoa = _kernel_combustivel(
+        distancia_total, consumo_km_litro, preco_combustivel, num_viajantes
+    )
 
     # Retorna valores formatados para exibição na interface
     return {
@@ -47,6 +72,28 @@ def calcular_combustivel(distancia_total, consumo_km_litro, preco_combustivel, n
 # ✈️ Função de Cálculo — Viagem Completa
 # --------------------------------------------
 
+def _kernel_completo(num_dias, num_viajantes, custo_acomodacao_noite, custo_transporte_total,
+                     custo_alimentacao_dia_pessoa, custo_atividades_total, percentual_reserva):
+    # Núcleo aritmético do orçamento completo (sem validação nem formatação).
+    # Total gasto com acomodação (por todas as noites)
+    total_acomodacao = custo_acomodacao_noite * num_dias
+    # Total gasto com alimentação (por dia por pessoa * dias * pessoas)
+    total_alimentacao = custo_alimentacao_dia_pessoa * num_dias * num_viajantes
+
+    # Subtotal antes da reserva de emergência
+    subtotal = total_acomodacao + custo_transporte_total + total_alimentacao + custo_atividades_total
+    # Valor da reserva de emergência em reais
+    reserva = subtotal * (percentual_reserva / 100)
+    # Custo final já com a reserva
+    custo_total_final = subtotal + reserva
+    # Custo por pessoa, reaproveitado no custo diário por pessoa
+    custo_por_pessoa = custo_total_final / num_viajantes
+    custo_por_dia_pessoa = custo_por_pessoa / num_dias
+
+    return (total_acomodacao, total_alimentacao, subtotal, reserva, custo_total_final,
+            custo_por_pessoa, custo_por_dia_pessoa)
+
+@st.cache_data(max_entries=128, show_spinner=False)
 def calcular_custos_completos(destino, num_dias, num_viajantes, custo_acomodacao_noite,
                               custo_transporte_total, custo_alimentacao_dia_pessoa,
                               custo_atividades_total, percentual_reserva):
@@ -60,46 +107,72 @@ def calcular_custos_completos(destino, num_dias, num_viajantes, custo_acomodacao
     # - `custo_atividades_total`: soma dos custos de passeios/atividades
     # - `percentual_reserva`: percentual de reserva/emergência aplicado ao subtotal
 
-    # Validações: dias e viajantes precisam ser maiores que zero
-    if num_dias <= 0 or num_viajantes <= 0:
-        return None
-
-    # Total gasto com acomodação (por todas as noites)
-    total_acomodacao = custo_acomodacao_noite * num_dias
-    # Total gasto com alimentação (por dia por pessoa * dias * pessoas)
-    total_alimentacao = custo_alimentacao_dia_pessoa * num_dias * num_viajantes
-
-    # Subtotal antes da reserva de emergência
-    subtotal = total_acomodacao + custo_transporte_total + total_alimentacao + custo_atividades_total
-    # Valor da reserva de emergência em reais
-    reserva = subtotal * (percentual_reserva / 100)
-    # Custo final já com a reserva
-    custo_total_final = subtotal + reserva
+    # Dias e viajantes já chegam positivos (`min_value=1` nos campos da interface);
+    # a checagem fica só como contrato de depuração (removida com `python -O`)
+    assert num_dias > 0 and num_viajantes > 0, "dias e viajantes devem ser maiores que zero"
+
+    (total_acomodacao, total_alimentacao, subtotal, reserva,
+     custo_total_final, custo_por_pessoa, custo_por_dia_pessoa) = _kernel_completo(
+        num_dias, num_viajantes, custo_acomodacao_noite, custo_transporte_total,
+        custo_alimentacao_dia_pessoa, custo_atividades_total, percentual_reserva
+    )
+
+    # Valores numéricos originais, usados no gráfico sem reconverter as strings
+    raw = {
+        "total_acomodacao": total_acomodacao,
+        "total_alimentacao": total_alimentacao,
+        "custo_transporte_total": custo_transporte_total,
+        "custo_atividades_total": custo_atividades_total,
+        "subtotal": subtotal,
+        "reserva": reserva,
+        "custo_total_final": custo_total_final,
+        "custo_por_pessoa": custo_por_pessoa,
+        "custo_por_dia_pessoa": custo_por_dia_pessoa
+    }
 
-    # Retorna todos os valores já formatados para exibição na UI
+    # Retorna todos os valores já formatados para exibição na UI,
+    # formatando os valores monetários numa única passada
     return {
         "destino": destino.upper(),
         "num_dias": num_dias,
         "num_viajantes": num_viajantes,
-        "total_acomodacao": formatar_moeda(total_acomodacao),
-        "total_alimentacao": formatar_moeda(total_alimentacao),
-        "custo_transporte_total": formatar_moeda(custo_transporte_total),
-        "custo_atividades_total": formatar_moeda(custo_atividades_total),
-        "subtotal": formatar_moeda(subtotal),
         "percentual_reserva": f"{percentual_reserva:.0f}%",
-        "reserva": formatar_moeda(reserva),
-        "custo_total_final": formatar_moeda(custo_total_final),
-        "custo_por_pessoa": formatar_moeda(custo_total_final / num_viajantes),
-        "custo_por_dia_pessoa": formatar_moeda((custo_total_final / num_viajantes) / num_dias)
+        **{chave: formatar_moeda(valor) for chave, valor in raw.items()},
+        "raw": raw
     }
 
+# --------------------------------------------
+# 📊 Recursos reutilizados entre execuções
+# --------------------------------------------
+
+@st.cache_resource
+def _grafico_barras(coluna_x="Categoria", coluna_y="Custo"):
+    # Especificação do gráfico de barras, montada uma única vez por par de colunas.
+    # Os dados são trocados a cada cálculo com `.properties(data=...)`.
+    import altair as alt
+    return alt.Chart().mark_bar().encode(
+        x=f"{coluna_x}:N",
+        y=f"{coluna_y}:Q"
+    ).properties(height=400)
+
+def _categorias(num_dias, num_viajantes, percentual_reserva):
+    # Rótulos das categorias do detalhamento, montados uma vez por exibição
+    # e compartilhados pela tabela e pelo gráfico.
+    return (
+        f"Acomodação ({num_dias} noites)",
+        "Transporte",
+        f"Alimentação ({num_viajantes} pessoas)",
+        "Atividades",
+        f"Reserva ({percentual_reserva})"
+    )
+
 # --------------------------------------------
 # 🎨 Configuração da Página
 # --------------------------------------------
 
-st.set_page_config(page_title="Simulador de Custos de Viagem", layout="wide")
-st.title("✈️ Simulador Inteligente de Custos de Viagem")
-st.caption("Calcule de forma rápida e fácil o custo total da viagem, combustível e custo por pessoa.")
+st.set_page_config(page_title=TITULO_PAGINA, layout="wide")
+st.title(TITULO)
+st.caption(LEGENDA)
 
 # --------------------------------------------
 # MENU LATERAL
@@ -107,127 +180,157 @@ st.caption("Calcule de forma rápida e fácil o custo total da viagem, combustí
 
 escolha = st.sidebar.selectbox(
     "Escolha o tipo de simulação:",
-    ("Simulação Completa da Viagem", "Simulação de Custo de Combustível")
+    OPCOES_SIMULACAO
 )
 
 # ============================================
 # 🔹 1 — SIMULAÇÃO COMPLETA DA VIAGEM
 # ============================================
 
-if escolha == "Simulação Completa da Viagem":
-
-    st.header("🧳 Simulação Completa da Viagem")
-
-    col1, col2, col3 = st.columns(3)
-    destino = col1.text_input("Destino:", "Paris")
-    num_dias = col2.number_input("Número de dias:", min_value=1, value=7)
-    num_viajantes = col3.number_input("Número de viajantes:", min_value=1, value=2)
-
-    st.subheader("💰 Custos da Viagem (R$)")
-    colA, colB = st.columns(2)
-    custo_acomodacao_noite = colA.number_input("Acomodação por noite (quarto total):", min_value=0.0, value=300.0)
-    custo_transporte_total = colB.number_input("Transporte total (voos, trens etc.):", min_value=0.0, value=2500.0)
-
-    colC, colD = st.columns(2)
-    custo_alimentacao_dia_pessoa = colC.number_input("Alimentação por dia por pessoa:", min_value=0.0, value=80.0)
-    custo_atividades_total = colD.number_input("Atividades e passeios (total):", min_value=0.0, value=500.0)
-
-    percentual_reserva = st.slider("Reserva de emergência (%)", 0, 100, 10)
-
-    if st.button("Calcular Custo Total"):
-        resultado = calcular_custos_completos(
-            destino, num_dias, num_viajantes, custo_acomodacao_noite,
-            custo_transporte_total, custo_alimentacao_dia_pessoa,
-            custo_atividades_total, percentual_reserva
-        )
-
-        if resultado:
-            st.success(f"Orçamento de viagem para **{resultado['destino']}** gerado com sucesso!")
-
-            st.subheader("📌 Resumo Geral")
-            colR1, colR2 = st.columns(2)
-            colR1.metric("Custo Total da Viagem", resultado["custo_total_final"])
-            colR2.metric("Custo por Pessoa", resultado["custo_por_pessoa"])
-
-            # ---------------------------
-            # 📊 Tabela e Gráfico
-            # ---------------------------
-            st.markdown("---")
-            st.subheader("📊 Detalhamento dos Custos")
-
-            df = pd.DataFrame({
-                "Categoria": [
-                    f"Acomodação ({resultado['num_dias']} noites)",
-                    "Transporte",
-                    f"Alimentação ({resultado['num_viajantes']} pessoas)",
-                    "Atividades",
-                    f"Reserva ({resultado['percentual_reserva']})"
-                ],
-                "Custo (R$)": [
-                    resultado["total_acomodacao"],
-                    resultado["custo_transporte_total"],
-                    resultado["total_alimentacao"],
-                    resultado["custo_atividades_total"],
-                    resultado["reserva"]
-                ]
-            })
-
-            st.table(df)
-
-            # Valores numéricos para o gráfico
-            valores_numericos = [
-                float(resultado["total_acomodacao"].replace("R$ ", "").replace(".", "").replace(",", ".")),
-                float(resultado["custo_transporte_total"].replace("R$ ", "").replace(".", "").replace(",", ".")),
-                float(resultado["total_alimentacao"].replace("R$ ", "").replace(".", "").replace(",", ".")),
-                float(resultado["custo_atividades_total"].replace("R$ ", "").replace(".", "").replace(",", ".")),
-                float(resultado["reserva"].replace("R$ ", "").replace(".", "").replace(",", "."))
-            ]
-
-            df_grafico = pd.DataFrame({
-                "Categoria": [
-                    f"Acomodação ({resultado['num_dias']} noites)",
-                    "Transporte",
-                    f"Alimentação ({resultado['num_viajantes']} pessoas)",
-                    "Atividades",
-                    f"Reserva ({resultado['percentual_reserva']})"
-                ],
-                "Custo": valores_numericos
-            })
-
-            chart = alt.Chart(df_grafico).mark_bar().encode(
-                x="Categoria",
-                y="Custo"
-            ).properties(height=400)
-
-            st.altair_chart(chart, use_container_width=True)
-
-            st.info(f"💡 Custo por dia por pessoa: **{resultado['custo_por_dia_pessoa']}**")
+# Campos da simulação, linha a linha: cada tupla vira uma linha de colunas e
+# cada string vira um subtítulo. `var` é o nome do argumento de cálculo.
+CAMPOS_COMPLETA = (
+    (
+        {"var": "destino", "widget": "text_input", "label": "Destino:", "value": "Paris"},
+        {"var": "num_dias", "widget": "number_input", "label": "Número de dias:", "min_value": 1, "value": 7},
+        {"var": "num_viajantes", "widget": "number_input", "label": "Número de viajantes:", "min_value": 1, "value": 2},
+    ),
+    "💰 Custos da Viagem (R$)",
+    (
+        {"var": "custo_acomodacao_noite", "widget": "number_input",
+         "label": "Acomodação por noite (quarto total):", "min_value": 0.0, "value": 300.0},
+        {"var": "custo_transporte_total", "widget": "number_input",
+         "label": "Transporte total (voos, trens etc.):", "min_value": 0.0, "value": 2500.0},
+    ),
+    (
+        {"var": "custo_alimentacao_dia_pessoa", "widget": "number_input",
+         "label": "Alimentação por dia por pessoa:", "min_value": 0.0, "value": 80.0},
+        {"var": "custo_atividades_total", "widget": "number_input",
+         "label": "Atividades e passeios (total):", "min_value": 0.0, "value": 500.0},
+    ),
+    (
+        {"var": "percentual_reserva", "widget": "slider", "label": "Reserva de emergência (%)",
+         "min_value": 0, "max_value": 100, "value": 10},
+    ),
+)
+
+def _exibir_completa(resultado):
+    # Altair só é carregado quando esta simulação é usada (a de combustível não precisa dele)
+    import altair as alt
+
+    st.success(f"Orçamento de viagem para **{resultado['destino']}** gerado com sucesso!")
+
+    st.subheader("📌 Resumo Geral")
+    colR1, colR2 = st.columns(2)
+    colR1.metric("Custo Total da Viagem", resultado["custo_total_final"])
+    colR2.metric("Custo por Pessoa", resultado["custo_por_pessoa"])
+
+    # ---------------------------
+    # 📊 Tabela e Gráfico
+    # ---------------------------
+    st.markdown("---")
+    st.subheader("📊 Detalhamento dos Custos")
+
+    categorias = _categorias(
+        resultado["num_dias"], resultado["num_viajantes"], resultado["percentual_reserva"]
+    )
+
+    chaves = ("total_acomodacao", "custo_transporte_total", "total_alimentacao",
+              "custo_atividades_total", "reserva")
+
+    st.table({
+        "Categoria": list(categorias),
+        "Custo (R$)": [resultado[chave] for chave in chaves]
+    })
+
+    # O gráfico recebe os valores numéricos diretamente, sem DataFrame
+    dados_grafico = alt.Data(values=[
+        {"Categoria": categoria, "Custo": resultado["raw"][chave]}
+        for categoria, chave in zip(categorias, chaves)
+    ])
+    st.altair_chart(
+        _grafico_barras().properties(data=dados_grafico),
+        use_container_width=True
+    )
+
+    st.info(f"💡 Custo por dia por pessoa: **{resultado['custo_por_dia_pessoa']}**")
 
 # ============================================
 # 🔹 2 — SIMULAÇÃO DE COMBUSTÍVEL
 # ============================================
 
-else:
-    st.header("⛽ Simulação de Custo de Combustível")
-
-    col1, col2 = st.columns(2)
-    distancia_total = col1.number_input("Distância total (km):", min_value=1, value=500)
-    consumo_km_litro = col2.number_input("Consumo do veículo (km/l):", min_value=1, value=12)
+CAMPOS_COMBUSTIVEL = (
+    (
+        {"var": "distancia_total", "widget": "number_input",
+         "label": "Distância total (km):", "min_value": 1, "value": 500},
+        {"var": "consumo_km_litro", "widget": "number_input",
+         "label": "Consumo do veículo (km/l):", "min_value": 1, "value": 12},
+    ),
+    (
+        {"var": "preco_combustivel", "widget": "number_input",
+         "label": "Preço do combustível (R$/L):", "min_value": 0.1, "value": 5.99},
+        {"var": "num_viajantes", "widget": "number_input",
+         "label": "Número de viajantes:", "min_value": 1, "value": 2},
+    ),
+)
 
-    col3, col4 = st.columns(2)
-    preco_combustivel = col3.number_input("Preço do combustível (R$/L):", min_value=0.1, value=5.99)
-    num_viajantes = col4.number_input("Número de viajantes:", min_value=1, value=2)
+def _exibir_combustivel(resultado):
+    if resultado:
+        st.success("Cálculo realizado com sucesso!")
 
-    if st.button("Calcular Combustível"):
-        resultado = calcular_combustivel(distancia_total, consumo_km_litro, preco_combustivel, num_viajantes)
+        st.metric("Custo Total", resultado["custo_total_combustivel"])
+        st.metric("Custo por Pessoa", resultado["custo_por_pessoa_combustivel"])
 
-        if resultado:
-            st.success("Cálculo realizado com sucesso!")
+        with st.expander("Detalhamento completo"):
+            st.write(f"Litros necessários: **{resultado['litros_necessarios']}**")
+            st.write(f"Preço por litro: **{resultado['preco_combustivel']}**")
+            st.write(f"Total de viajantes: **{resultado['num_viajantes']}**")
 
-            st.metric("Custo Total", resultado["custo_total_combustivel"])
-            st.metric("Custo por Pessoa", resultado["custo_por_pessoa_combustivel"])
+# ============================================
+# ▶️ Execução da simulação escolhida
+# ============================================
 
-            with st.expander("Detalhamento completo"):
-                st.write(f"Litros necessários: **{resultado['litros_necessarios']}**")
-                st.write(f"Preço por litro: **{resultado['preco_combustivel']}**")
-                st.write(f"Total de viajantes: **{resultado['num_viajantes']}**")
+SIMULACOES = {
+    OPCOES_SIMULACAO[0]: {
+        "titulo": "🧳 Simulação Completa da Viagem",
+        "campos": CAMPOS_COMPLETA,
+        "botao": "Calcular Custo Total",
+        "calculo": calcular_custos_completos,
+        "exibir": _exibir_completa,
+    },
+    OPCOES_SIMULACAO[1]: {
+        "titulo": "⛽ Simulação de Custo de Combustível",
+        "campos": CAMPOS_COMBUSTIVEL,
+        "botao": "Calcular Combustível",
+        "calculo": calcular_combustivel,
+        "exibir": _exibir_combustivel,
+    },
+}
+
+def _coletar(campos):
+    # Desenha os campos descritos em `campos` e devolve {var: valor informado}.
+    valores = {}
+    for linha in campos:
+        if isinstance(linha, str):
+            st.subheader(linha)
+            continue
+        colunas = st.columns(len(linha)) if len(linha) > 1 else (st,)
+        for coluna, campo in zip(colunas, linha):
+            opcoes = {k: v for k, v in campo.items() if k not in ("var", "widget", "label")}
+            widget = getattr(coluna, campo["widget"])
+            valores[campo["var"]] = widget(campo["label"], **opcoes)
+    return valores
+
+# A simulação roda como fragmento: interações dentro dela (como o botão de
+# cálculo) reexecutam apenas a própria seção, não a página inteira.
+@st.fragment
+def _simulacao(escolha):
+    simulacao = SIMULACOES[escolha]
+    st.header(simulacao["titulo"])
+
+    valores = _coletar(simulacao["campos"])
+
+    if st.button(simulacao["botao"]):
+        simulacao["exibir"](simulacao["calculo"](**valores))
+
+_simulacao(escolha)